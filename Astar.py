@@ -1,104 +1,36 @@
 """
 Solo (Peg Solitaire) CLI game on the 7x7 English board shape.
 
-Internal board:
-  -1 = invalid / corner
-   0 = empty hole
-   1 = peg
+Boards are flat bytearrays from board_array (one byte per cell r*7 + c:
+2 = invalid / corner, 0 = empty hole, 1 = peg).
 """
 
-from typing import List, Tuple, Dict
+from typing import List, Dict
 import sys
-from copy import deepcopy
 import bisect
 import winsound
 import math
 from math import ceil
 
+from board_array import board, COLS, index_to_pos, render, legal_moves, peg_count, serialize
 
 
 
-# Board pattern (holes)
-TEMPLATE = [
-    "  xxx",
-    "  xxx",
-    "xxxxxxx",
-    "xxxoxxx",
-    "xxxxxxx",
-    "  xxx",
-    "  xxx"
-]
+
+# Print every expanded board and its legal moves (slows the search down a lot)
+DEBUG = False
 
 class treenodes:
     def __init__(self, board, parent=None, move=None, cost=0):
         self.board = board
         self.parent = parent
         self.move = move
+        # Visited-set key, computed once per node
+        self.key = serialize(board)
         self.cost = cost
 
-ROWS, COLS = 7, 7
-
-# Build the 7x7 state array
-board: List[List[int]] = [[-1]*COLS for _ in range(ROWS)]
-index_to_pos: Dict[int, Tuple[int, int]] = {}
-pos_to_index: Dict[Tuple[int, int], int] = {}
-
-idx = 1
-for r, row in enumerate(TEMPLATE):
-    for c, ch in enumerate(row):
-        if ch in ("x", "o"):
-            pos_to_index[(r, c)] = idx
-            index_to_pos[idx] = (r, c)
-            board[r][c] = 1 if ch == "x" else 0
-            idx += 1
-
-NUM_HOLES = idx - 1
-
-# Directions for orthogonal jumps: (dr, dc)
-DIRECTIONS = [(-1, 0), (1, 0), (0, -1), (0, 1)]
-
-# ---------------------------------------------------------
-
-def render(current_board) -> str:
-    """Return a multi-line string showing the current board."""
-    lines = []
-    for r in range(ROWS):
-        out = []
-        for c in range(COLS):
-            val = current_board[r][c]
-            if val == -1:
-                out.append("  ")
-            else:
-                out.append("x " if val == 1 else "o ")
-        lines.append("".join(out))
-    return "\n".join(lines)
-
 # ---------------------------------------------------------
 
-def legal_moves(current_board) -> List[Tuple[int, int]]:
-    """Return list of legal moves as (from_idx, to_idx)."""
-    moves = []
-    for frm, (r, c) in index_to_pos.items():
-        if current_board[r][c] != 1:
-            continue
-        for dr, dc in DIRECTIONS:
-            mid_r, mid_c = r + dr, c + dc
-            to_r, to_c = r + 2*dr, c + 2*dc
-            if (
-                0 <= to_r < ROWS and 0 <= to_c < COLS and
-                current_board[mid_r][mid_c] == 1 and
-                current_board[to_r][to_c] == 0
-            ):
-                moves.append((frm, pos_to_index[(to_r, to_c)]))
-    return moves
-
-# ---------------------------------------------------------
-
-
-def peg_count(current_board) -> int:
-    return sum(cell == 1 for row in current_board for cell in row)
-
-
 def print_status(current_board):
     print(render(current_board))
     print(f"Pegs remaining: {peg_count(current_board)}")
@@ -118,38 +50,35 @@ def list_moves(current_board):
         print(f"{f} -> {tos}")
 
 # ---------------------------------------------------------
-def serialize(board_state):
-    """Convert a 7x7 board into a hashable tuple for visited-state checking."""
-    return tuple(tuple(cell for cell in row) for row in board_state)
-
 priority_queue = []
 pq_costs = []
-chechked_boards = []
-explored = []
+# Boards already expanded. Cost depends on the path, so a board may be queued
+# once per parent; the cheapest copy is popped first and later copies are skipped
+explored = set()
 
-def generate_child_boards(current_board):
+def generate_child_boards(current_board, possible_moves):
     """
-    Given a board state, generate all possible child boards
-    by applying every legal move once.
+    Given a board state and its legal moves, generate all possible
+    child boards by applying every legal move once.
     Returns a list of (new_board, move) pairs,
     where move = (from_idx, to_idx).
     """
     children = []
-    possible_moves = legal_moves(current_board.board)
     
     for from_idx, to_idx in possible_moves:
-        # Copy the board so we don't modify the original
-        new_board = deepcopy(current_board.board)
+        # Copy the board (one memcpy) so we don't modify the original
+        new_board = bytearray(current_board.board)
         
         # Apply the move on the copied board
         r1, c1 = index_to_pos[from_idx]
         r2, c2 = index_to_pos[to_idx]
-        mid_r, mid_c = (r1 + r2) // 2, (c1 + c2) // 2
+        from_cell, to_cell = r1*COLS + c1, r2*COLS + c2
+        mid_cell = (from_cell + to_cell) // 2
         
         # Execute the move (peg jump)
-        new_board[r1][c1] = 0
-        new_board[mid_r][mid_c] = 0
-        new_board[r2][c2] = 1
+        new_board[from_cell] = 0
+        new_board[mid_cell] = 0
+        new_board[to_cell] = 1
         
         child_cost = ceil(current_board.cost) + heuristic(new_board)  # Example cost function: increment by 1 per move
         
@@ -172,20 +101,21 @@ def print_path(node):
         print()
 
 def UCS():
-    first_copy = treenodes([row[:] for row in board], None,0)
+    first_copy = treenodes(bytearray(board), None,0)
     priority_queue.append(first_copy)
     pq_costs.append(first_copy.cost)
-    chechked_boards.append(serialize(first_copy.board))
     while True:
         if not priority_queue:
             print("No solution found.")
             break
-        print("\nCurrent board:")
         node = priority_queue.pop(0)
         pq_costs.pop(0)
-        explored.append(node)
-        chechked_boards.append(serialize(node.board))
-        print_status(node.board)
+        if node.key in explored:
+            continue
+        explored.add(node.key)
+        if DEBUG:
+            print("\nCurrent board:")
+            print_status(node.board)
         
         '''
         if peg_count(node.board) == 1:
@@ -193,7 +123,8 @@ def UCS():
             print_path(node)
             break
         '''
-        if not  legal_moves(node.board):
+        moves = legal_moves(node.board)
+        if not moves:
             print("\n★ You win! Max peg remains. ★")
             print_path(node)
             break
@@ -203,19 +134,17 @@ def UCS():
             freq = 440  # Hz
             winsound.Beep(freq, duration)
         
-        list_moves(node.board)
+        if DEBUG:
+            list_moves(node.board)
         #children = [child for child, move in generate_child_boards(node)]
-        children = generate_child_boards(node)
+        children = generate_child_boards(node, moves)
         for child in children:
-            serialized_child = serialize(child.board)
-            if serialized_child not in explored:
-                add_to_priority_queue(child)
+            add_to_priority_queue(child)
 
 
 #---------------------------------------------------------
 def add_to_priority_queue(state):
-    serialized_board = serialize(state.board)
-    if serialized_board not in chechked_boards:
+    if state.key not in explored:
         index = bisect.bisect_left(pq_costs, state.cost)
         priority_queue.insert(index, (state))
         pq_costs.insert(index, state.cost)
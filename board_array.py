@@ -0,0 +1,64 @@
+"""
+Board tables and move generation shared by the Solo (Peg Solitaire) scripts
+that keep the board as a flat bytearray with one byte per cell (r*7 + c):
+   2 = invalid / corner
+   0 = empty hole
+   1 = peg
+
+The hole layout and numbering come from board_core.
+"""
+
+from typing import List, Tuple
+
+from board_core import ROWS, COLS, VALID_MASK, pegs, index_to_pos, pos_to_index, DIRECTIONS
+
+# Build the flat 7x7 state array
+board = bytearray(
+    1 if pegs >> cell & 1 else 0 if VALID_MASK >> cell & 1 else 2
+    for cell in range(ROWS*COLS)
+)
+
+# Every geometrically possible jump, grouped by starting hole as
+# (from_idx, from_cell, [(to_idx, mid_cell, to_cell), ...])
+JUMPS: List[Tuple[int, int, List[Tuple[int, int, int]]]] = []
+for frm, (r, c) in index_to_pos.items():
+    jumps = []
+    for dr, dc in DIRECTIONS:
+        mid, dest = (r + dr, c + dc), (r + 2*dr, c + 2*dc)
+        if mid in pos_to_index and dest in pos_to_index:
+            jumps.append((pos_to_index[dest], mid[0]*COLS + mid[1], dest[0]*COLS + dest[1]))
+    JUMPS.append((frm, r*COLS + c, jumps))
+
+# Turns each cell into its display character: empty "o", peg "x", invalid " "
+CELL_CHARS = bytes.maketrans(b"\x00\x01\x02", b"ox ")
+
+# Turns peg cells into b"1" and empty/invalid cells into b"0"
+PEG_DIGITS = bytes.maketrans(b"\x00\x01\x02", b"010")
+
+# ---------------------------------------------------------
+
+def render(current_board) -> str:
+    """Return a multi-line string showing the current board."""
+    # One translate for the whole board, then each row is a slice
+    cells = current_board.translate(CELL_CHARS).decode()
+    return "\n".join(" ".join(cells[i:i + COLS]) + " " for i in range(0, ROWS*COLS, COLS))
+
+def legal_moves(current_board) -> List[Tuple[int, int]]:
+    """Return list of legal moves as (from_idx, to_idx)."""
+    moves = []
+    for frm, cell, jumps in JUMPS:
+        # Test the starting peg once for all of its jumps
+        if current_board[cell] != 1:
+            continue
+        for to, mid, dest in jumps:
+            if current_board[mid] == 1 and current_board[dest] == 0:
+                moves.append((frm, to))
+    return moves
+
+def peg_count(current_board) -> int:
+    return current_board.count(1)
+
+def serialize(board_state) -> int:
+    """Convert a board into an int with bit r*7 + c set for each peg, for visited-state checking."""
+    # Reversed so that cell 0 becomes the lowest bit
+    return int(board_state.translate(PEG_DIGITS)[::-1], 2)
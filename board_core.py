@@ -0,0 +1,181 @@
+"""
+Board tables and move generation shared by the Solo (Peg Solitaire) scripts
+on the 7x7 English board shape.
+
+Boards are int bitboards (bit r*7 + c for the hole at row r, col c):
+  VALID_MASK = every hole on the board
+  pegs       = the starting board
+"""
+
+from functools import lru_cache
+from typing import List, Tuple, Dict
+
+# Board pattern (holes)
+TEMPLATE = [
+    "  xxx",
+    "  xxx",
+    "xxxxxxx",
+    "xxxoxxx",
+    "xxxxxxx",
+    "  xxx",
+    "  xxx"
+]
+
+ROWS, COLS = 7, 7
+
+# Build the bitboards: the hole at (r, c) is bit r*COLS + c.
+# VALID_MASK has a bit set for every hole, pegs for every hole holding a peg.
+VALID_MASK = 0
+pegs = 0
+index_to_pos: Dict[int, Tuple[int, int]] = {}
+pos_to_index: Dict[Tuple[int, int], int] = {}
+index_to_bit: Dict[int, int] = {}
+bit_to_index: Dict[int, int] = {}
+
+idx = 1
+for r, row in enumerate(TEMPLATE):
+    for c, ch in enumerate(row):
+        if ch in ("x", "o"):
+            bit = 1 << (r*COLS + c)
+            pos_to_index[(r, c)] = idx
+            index_to_pos[idx] = (r, c)
+            index_to_bit[idx] = bit
+            bit_to_index[bit] = idx
+            VALID_MASK |= bit
+            if ch == "x":
+                pegs |= bit
+            idx += 1
+
+NUM_HOLES = idx - 1
+
+# Directions for orthogonal jumps: (dr, dc)
+DIRECTIONS = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+
+# One (step, from_mask) pair per direction: a jump goes from bit b over
+# b + step to b + 2*step, and from_mask marks the holes it can start from.
+# JUMPS_FROM[from_bit] lists the same jumps per hole as (direction, over_bit, to_bit).
+JUMP_MASKS: List[Tuple[int, int]] = []
+JUMPS_FROM: Dict[int, List[Tuple[int, int, int]]] = {bit: [] for bit in bit_to_index}
+for d, (dr, dc) in enumerate(DIRECTIONS):
+    from_mask = 0
+    for (r, c) in index_to_pos.values():
+        mid, dest = (r + dr, c + dc), (r + 2*dr, c + 2*dc)
+        if mid in pos_to_index and dest in pos_to_index:
+            from_bit = 1 << (r*COLS + c)
+            from_mask |= from_bit
+            JUMPS_FROM[from_bit].append((
+                d,
+                1 << (mid[0]*COLS + mid[1]),
+                1 << (dest[0]*COLS + dest[1]),
+            ))
+    JUMP_MASKS.append((dr*COLS + dc, from_mask))
+
+# The 8 symmetries of the board (rotations and reflections) as (r, c) -> (r, c)
+SYMMETRIES = [
+    lambda r, c: (r, c),
+    lambda r, c: (c, ROWS - 1 - r),
+    lambda r, c: (ROWS - 1 - r, COLS - 1 - c),
+    lambda r, c: (COLS - 1 - c, r),
+    lambda r, c: (r, COLS - 1 - c),
+    lambda r, c: (ROWS - 1 - r, c),
+    lambda r, c: (c, r),
+    lambda r, c: (COLS - 1 - c, ROWS - 1 - r),
+]
+
+# SYMMETRY_TABLES[s][r][row_bits] is the image under symmetry s of the pegs
+# in row r, so a whole board is mapped with one table lookup per row.
+SYMMETRY_TABLES: List[List[List[int]]] = []
+for sym in SYMMETRIES:
+    row_tables = []
+    for r in range(ROWS):
+        table = []
+        for row_bits in range(1 << COLS):
+            image = 0
+            for c in range(COLS):
+                if row_bits >> c & 1:
+                    sym_r, sym_c = sym(r, c)
+                    image |= 1 << (sym_r*COLS + sym_c)
+            table.append(image)
+        row_tables.append(table)
+    SYMMETRY_TABLES.append(row_tables)
+
+# ---------------------------------------------------------
+
+# ROW_STRINGS[r][bits] is row r rendered with its 7 peg bits set to bits
+ROW_STRINGS: List[List[str]] = [
+    ["".join("  " if not VALID_MASK >> (r*COLS + c) & 1
+             else ("x " if bits >> c & 1 else "o ")
+             for c in range(COLS))
+     for bits in range(1 << COLS)]
+    for r in range(ROWS)
+]
+
+# The hole numbers never change, so that view is built once
+NUMBERED_BOARD = "\n".join(
+    "".join(f"{pos_to_index[(r, c)]:02d}" if (r, c) in pos_to_index else "  "
+            for c in range(COLS))
+    for r in range(ROWS)
+)
+
+def render(pegs: int, show_numbers: bool = False) -> str:
+    """Return a multi-line string showing the current board."""
+    if show_numbers:
+        return NUMBERED_BOARD
+    # One table lookup per row instead of a string per cell
+    return "\n".join(table[pegs >> (r*COLS) & 0x7F] for r, table in enumerate(ROW_STRINGS))
+
+# ---------------------------------------------------------
+
+def legal_moves(pegs: int) -> List[Tuple[int, int, int]]:
+    """Return list of legal moves as (from_bit, over_bit, to_bit)."""
+    # All jumps in one direction are found at once by shifting the whole
+    # board; the start holes are then walked in hole order so the moves come
+    # out in the same order as a hole-by-hole scan.
+    empty = VALID_MASK & ~pegs
+    starts = [
+        pegs & (pegs >> step) & (empty >> 2*step) & from_mask if step > 0
+        else pegs & (pegs << -step) & (empty << -2*step) & from_mask
+        for step, from_mask in JUMP_MASKS
+    ]
+    moves = []
+    pending = starts[0] | starts[1] | starts[2] | starts[3]
+    while pending:
+        f = pending & -pending
+        pending ^= f
+        for d, m, t in JUMPS_FROM[f]:
+            if starts[d] & f:
+                moves.append((f, m, t))
+    return moves
+
+
+# Shared by every search in the process; the same board is reached through
+# many move orders, so most heuristic lookups are hits
+@lru_cache(maxsize=1 << 20)
+def move_count(pegs: int) -> int:
+    """Return len(legal_moves(pegs)) without building the move list."""
+    empty = VALID_MASK & ~pegs
+    count = 0
+    for step, from_mask in JUMP_MASKS:
+        if step > 0:
+            count += (pegs & (pegs >> step) & (empty >> 2*step) & from_mask).bit_count()
+        else:
+            count += (pegs & (pegs << -step) & (empty << -2*step) & from_mask).bit_count()
+    return count
+
+# ---------------------------------------------------------
+
+
+def canonical(pegs: int) -> int:
+    """Return the smallest of the 8 symmetric images of a board (visited-set key)."""
+    rows = [pegs >> (r*COLS) & 0x7F for r in range(ROWS)]
+    # Row images never share a bit, so summing them is the same as OR-ing
+    return min(
+        sum(table[row_bits] for table, row_bits in zip(row_tables, rows))
+        for row_tables in SYMMETRY_TABLES
+    )
+
+
+def peg_count(pegs: int) -> int:
+    return pegs.bit_count()
+
+
@@ -1,95 +1,64 @@
 """
 Solo (Peg Solitaire) CLI game on the 7x7 English board shape.
 
-Internal board:
-  -1 = invalid / corner
-   0 = empty hole
-   1 = peg
+Boards are flat bytearrays from board_array (one byte per cell r*7 + c:
+2 = invalid / corner, 0 = empty hole, 1 = peg).
 """
 
 from typing import List, Tuple, Dict
 import sys
-from copy import deepcopy
-
-# Board pattern (holes)
-TEMPLATE = [
-    "  xxx",
-    "  xxx",
-    "xxxxxxx",
-    "xxxoxxx",
-    "xxxxxxx",
-    "  xxx",
-    "  xxx"
-]
-
-class treenodes:
-    def __init__(self, board, parent=None, move=None):
-        self.board = board
-        self.parent = parent
-        self.move = move
-ROWS, COLS = 7, 7
-
-# Build the 7x7 state array
-board: List[List[int]] = [[-1]*COLS for _ in range(ROWS)]
-index_to_pos: Dict[int, Tuple[int, int]] = {}
-pos_to_index: Dict[Tuple[int, int], int] = {}
 
-idx = 1
-for r, row in enumerate(TEMPLATE):
-    for c, ch in enumerate(row):
-        if ch in ("x", "o"):
-            pos_to_index[(r, c)] = idx
-            index_to_pos[idx] = (r, c)
-            board[r][c] = 1 if ch == "x" else 0
-            idx += 1
+from board_core import canonical
+from board_array import board, JUMPS, render, legal_moves, peg_count, serialize
 
-NUM_HOLES = idx - 1
-
-# Directions for orthogonal jumps: (dr, dc)
-DIRECTIONS = [(-1, 0), (1, 0), (0, -1), (0, 1)]
-
-# ---------------------------------------------------------
+# Print every expanded board and its legal moves (slows the search down a lot)
+DEBUG = False
 
-def render(current_board) -> str:
-    """Return a multi-line string showing the current board."""
-    lines = []
-    for r in range(ROWS):
-        out = []
-        for c in range(COLS):
-            val = current_board[r][c]
-            if val == -1:
-                out.append("  ")
-            else:
-                out.append("x " if val == 1 else "o ")
-        lines.append("".join(out))
-    return "\n".join(lines)
+# Every jump as (from_idx, to_idx, from_cell, mid_cell, to_cell), in
+# legal_moves() order. The move set in DLS holds positions in this list,
+# so sorting it gives back that order. JUMP_ID maps (from_idx, to_idx) back.
+JUMP_LIST: List[Tuple[int, int, int, int, int]] = [
+    (frm, to, cell, mid, dest) for frm, cell, jumps in JUMPS for to, mid, dest in jumps
+]
+JUMP_ID: Dict[Tuple[int, int], int] = {jump[:2]: j for j, jump in enumerate(JUMP_LIST)}
+
+# For each jump, every jump sharing one of its three cells, listed once.
+# Only these can change legality when it is played.
+JUMPS_THROUGH: Dict[int, List[int]] = {}
+for j, (_, _, cell, mid, dest) in enumerate(JUMP_LIST):
+    for touched in (cell, mid, dest):
+        JUMPS_THROUGH.setdefault(touched, []).append(j)
+AFFECTED: List[Tuple[int, ...]] = [
+    tuple(sorted(set(JUMPS_THROUGH[cell] + JUMPS_THROUGH[mid] + JUMPS_THROUGH[dest])))
+    for _, _, cell, mid, dest in JUMP_LIST
+]
 
 # ---------------------------------------------------------
 
-def legal_moves(current_board) -> List[Tuple[int, int]]:
-    """Return list of legal moves as (from_idx, to_idx)."""
-    moves = []
-    for frm, (r, c) in index_to_pos.items():
-        if current_board[r][c] != 1:
-            continue
-        for dr, dc in DIRECTIONS:
-            mid_r, mid_c = r + dr, c + dc
-            to_r, to_c = r + 2*dr, c + 2*dc
-            if (
-                0 <= to_r < ROWS and 0 <= to_c < COLS and
-                current_board[mid_r][mid_c] == 1 and
-                current_board[to_r][to_c] == 0
-            ):
-                moves.append((frm, pos_to_index[(to_r, to_c)]))
-    return moves
+def update_moves(current_board, moves, jump):
+    """
+    Re-check the jumps affected by playing jump and patch the moves set in
+    place. Returns the (added, removed) jump ids so the patch can be undone.
+    """
+    added = []
+    removed = []
+    for k in AFFECTED[jump]:
+        _, _, from_cell, mid_cell, to_cell = JUMP_LIST[k]
+        if (
+            current_board[from_cell] == 1 and
+            current_board[mid_cell] == 1 and
+            current_board[to_cell] == 0
+        ):
+            if k not in moves:
+                moves.add(k)
+                added.append(k)
+        elif k in moves:
+            moves.remove(k)
+            removed.append(k)
+    return added, removed
 
 # ---------------------------------------------------------
 
-
-def peg_count(current_board) -> int:
-    return sum(cell == 1 for row in current_board for cell in row)
-
-
 def print_status(current_board):
     print(render(current_board))
     print(f"Pegs remaining: {peg_count(current_board)}")
@@ -109,81 +78,81 @@ def list_moves(current_board):
         print(f"{f} -> {tos}")
 
 # ---------------------------------------------------------
-def serialize(board_state):
-    """Convert a 7x7 board into a hashable tuple for visited-state checking."""
-    return tuple(tuple(cell for cell in row) for row in board_state)
-
-frontier = []
-chechked_boards = []
-explored = []
-
-def generate_child_boards(current_board):
-    """
-    Given a board state, generate all possible child boards
-    by applying every legal move once.
-    Returns a list of (new_board, move) pairs,
-    where move = (from_idx, to_idx).
-    """
-    children = []
-    possible_moves = legal_moves(current_board.board)
-    
-    for from_idx, to_idx in possible_moves:
-        # Copy the board so we don't modify the original
-        new_board = deepcopy(current_board.board)
-        
-        # Apply the move on the copied board
-        r1, c1 = index_to_pos[from_idx]
-        r2, c2 = index_to_pos[to_idx]
-        mid_r, mid_c = (r1 + r2) // 2, (c1 + c2) // 2
-        
-        # Execute the move (peg jump)
-        new_board[r1][c1] = 0
-        new_board[mid_r][mid_c] = 0
-        new_board[r2][c2] = 1
-        
-        children.append(treenodes(new_board, current_board,(from_idx, to_idx)))
-    
-    return children
+# Both sets hold canonical keys: the 8 symmetric images of a board have the
+# same peg count (so the same depth) and the same outcome
+explored = set()
+# Boards proven to have no solution below them; kept across depth limits
+unsolvable = set()
 
 def IDDFS():
     depth = 0
     while True:
         print(f"\nSearching with depth limit: {depth}")
-        first_copy = treenodes([row[:] for row in board], None)
+        first_copy = bytearray(board)
         explored.clear()
-        if DLS(first_copy, depth):
+        if DLS(first_copy, depth, {JUMP_ID[move] for move in legal_moves(first_copy)}):
             return
         depth += 1
 
-def DLS(node, depth):
-    print_status(node.board)
-    list_moves(node.board)
+def DLS(current_board, depth, moves):
+    """
+    Depth-limited search that applies each move to current_board in place
+    and undoes it after the recursive call, so no board is ever copied.
+    moves is the set of legal jump ids on current_board; before recursing it
+    is patched with update_moves() instead of being regenerated, and the
+    patch is undone afterwards.
+    Returns True when a solution is found, False when there is none below
+    this board and None when the depth limit cut the search short.
+    """
+    if DEBUG:
+        print_status(current_board)
     
-    if peg_count(node.board) == 1:
+    if peg_count(current_board) == 1:
         print("\n★ You win! Only one peg remains. ★")
         return True
     '''
-    if not legal_moves(node.board):
+    if not legal_moves(current_board):
         print("\n★ You win! Max peg remains. ★")
         return True
     '''
     if depth <= 0:
-        return False
+        return None if moves else False
     
-    list_moves(node.board)
-    children = generate_child_boards(node)
-    for child in children:
-        serialized_child = serialize(child.board)
-        if serialized_child not in explored:
-            explored.append(serialized_child)
-            if DLS(child, depth - 1):
-                return True
-    return False
-
-#---------------------------------------------------------
-def add_to_frontier(state):
-    if state not in chechked_boards:
-        frontier.append(state)
+    if DEBUG:
+        list_moves(current_board)
+    result = False
+    for jump in sorted(moves):
+        _, _, from_cell, mid_cell, to_cell = JUMP_LIST[jump]
+
+        # Make the move
+        current_board[from_cell] = 0
+        current_board[mid_cell] = 0
+        current_board[to_cell] = 1
+
+        found = None
+        serialized_child = canonical(serialize(current_board))
+        if serialized_child in unsolvable:
+            found = False
+        elif serialized_child not in explored:
+            explored.add(serialized_child)
+            added, removed = update_moves(current_board, moves, jump)
+            found = DLS(current_board, depth - 1, moves)
+            moves.difference_update(added)
+            moves.update(removed)
+
+        # Unmake the move
+        current_board[from_cell] = 1
+        current_board[mid_cell] = 1
+        current_board[to_cell] = 0
+
+        if found:
+            return True
+        if found is None:
+            result = None
+
+    if result is False:
+        unsolvable.add(canonical(serialize(current_board)))
+    return result
 
 #---------------------------------------------------------
 
@@ -14,37 +14,20 @@ xxxxxxx
 from typing import Tuple, Dict, List
 import sys
 
-# Board template: 'x' = peg hole, 'o' = empty hole, ' ' = no-slot
-TEMPLATE = [
-    "  xxx",
-    "  xxx",
-    "xxxxxxx",
-    "xxxoxxx",
-    "xxxxxxx",
-    "  xxx",
-    "  xxx"
-]
-
-# Build mapping: index -> (r,c) and (r,c) -> index for only valid holes
-index_to_pos: Dict[int, Tuple[int, int]] = {}
-pos_to_index: Dict[Tuple[int, int], int] = {}
-
-idx = 1
-for r, row in enumerate(TEMPLATE):
-    for c, ch in enumerate(row):
-        if ch in ("x", "o"):
-            index_to_pos[idx] = (r, c)
-            pos_to_index[(r, c)] = idx
-            idx += 1
-NUM_HOLES = idx - 1
+from board_core import TEMPLATE, DIRECTIONS, index_to_pos, pos_to_index
 
 # Initial state: True = peg present, False = empty
 state: Dict[int, bool] = {}
 for i, (r, c) in index_to_pos.items():
     state[i] = (TEMPLATE[r][c] == "x")
 
-# Directions for orthogonal jumps: (dr, dc)
-DIRECTIONS = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+# Every geometrically possible jump as (from_idx, over_idx, to_idx)
+JUMPS: List[Tuple[int, int, int]] = []
+for i, (r, c) in index_to_pos.items():
+    for dr, dc in DIRECTIONS:
+        mid, dest = (r + dr, c + dc), (r + 2*dr, c + 2*dc)
+        if mid in pos_to_index and dest in pos_to_index:
+            JUMPS.append((i, pos_to_index[mid], pos_to_index[dest]))
 
 def render(show_numbers: bool = False) -> str:
     """Return a multi-line string showing the current board."""
@@ -65,20 +48,7 @@ def render(show_numbers: bool = False) -> str:
 
 def legal_moves() -> List[Tuple[int, int]]:
     """Return list of legal moves as (from_idx, to_idx)."""
-    moves = []
-    for i, occupied in state.items():
-        if not occupied:
-            continue
-        r, c = index_to_pos[i]
-        for dr, dc in DIRECTIONS:
-            mid = (r + dr, c + dc)
-            dest = (r + 2*dr, c + 2*dc)
-            if mid in pos_to_index and dest in pos_to_index:
-                mid_idx = pos_to_index[mid]
-                dest_idx = pos_to_index[dest]
-                if state[mid_idx] and not state[dest_idx]:
-                    moves.append((i, dest_idx))
-    return moves
+    return [(f, t) for f, o, t in JUMPS if state[f] and state[o] and not state[t]]
 
 def is_valid_move(frm: int, to: int) -> bool:
     if frm not in state or to not in state:
@@ -1,84 +1,27 @@
 """
 Solo (Peg Solitaire) CLI game on the 7x7 English board shape.
 
-Internal board:
-  -1 = invalid / corner
-   0 = empty hole
-   1 = peg
+Internal board is an int bitboard from board_core (bit r*7 + c for the
+hole at row r, col c); pegs holds the holes that currently have a peg.
 """
 
 from typing import List, Tuple, Dict
 import sys
 
-# Board pattern (holes)
-TEMPLATE = [
-    "  xxx",
-    "  xxx",
-    "xxxxxxx",
-    "xxxoxxx",
-    "xxxxxxx",
-    "  xxx",
-    "  xxx"
-]
-
-ROWS, COLS = 7, 7
-
-# Build the 7x7 state array
-board: List[List[int]] = [[-1]*COLS for _ in range(ROWS)]
-index_to_pos: Dict[int, Tuple[int, int]] = {}
-pos_to_index: Dict[Tuple[int, int], int] = {}
-
-idx = 1
-for r, row in enumerate(TEMPLATE):
-    for c, ch in enumerate(row):
-        if ch in ("x", "o"):
-            pos_to_index[(r, c)] = idx
-            index_to_pos[idx] = (r, c)
-            board[r][c] = 1 if ch == "x" else 0
-            idx += 1
-
-NUM_HOLES = idx - 1
-
-# Directions for orthogonal jumps: (dr, dc)
-DIRECTIONS = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+import board_core
+from board_core import COLS, pegs, index_to_pos, index_to_bit, bit_to_index
 
 # ---------------------------------------------------------
 
 def render(show_numbers: bool = False) -> str:
     """Return a multi-line string showing the current board."""
-    lines = []
-    for r in range(ROWS):
-        out = []
-        for c in range(COLS):
-            val = board[r][c]
-            if val == -1:
-                out.append("  ")
-            else:
-                if show_numbers:
-                    out.append(f"{pos_to_index[(r, c)]:02d}")
-                else:
-                    out.append("x " if val == 1 else "o ")
-        lines.append("".join(out))
-    return "\n".join(lines)
+    return board_core.render(pegs, show_numbers)
 
 # ---------------------------------------------------------
 
-def legal_moves() -> List[Tuple[int, int]]:
-    """Return list of legal moves as (from_idx, to_idx)."""
-    moves = []
-    for frm, (r, c) in index_to_pos.items():
-        if board[r][c] != 1:
-            continue
-        for dr, dc in DIRECTIONS:
-            mid_r, mid_c = r + dr, c + dc
-            to_r, to_c = r + 2*dr, c + 2*dc
-            if (
-                0 <= to_r < ROWS and 0 <= to_c < COLS and
-                board[mid_r][mid_c] == 1 and
-                board[to_r][to_c] == 0
-            ):
-                moves.append((frm, pos_to_index[(to_r, to_c)]))
-    return moves
+def legal_moves() -> List[Tuple[int, int, int]]:
+    """Return list of legal moves as (from_bit, over_bit, to_bit)."""
+    return board_core.legal_moves(pegs)
 
 # ---------------------------------------------------------
 
@@ -87,7 +30,7 @@ def is_valid_move(frm: int, to: int) -> bool:
         return False
     r1, c1 = index_to_pos[frm]
     r2, c2 = index_to_pos[to]
-    if board[r1][c1] != 1 or board[r2][c2] != 0:
+    if not pegs & index_to_bit[frm] or pegs & index_to_bit[to]:
         return False
     dr, dc = r2 - r1, c2 - c1
     if abs(dr) == 2 and dc == 0:
@@ -97,26 +40,25 @@ def is_valid_move(frm: int, to: int) -> bool:
     else:
         return False
     mid_r, mid_c = mid
-    return board[mid_r][mid_c] == 1
+    return bool(pegs & (1 << (mid_r*COLS + mid_c)))
 
 # ---------------------------------------------------------
 
 def make_move(frm: int, to: int) -> bool:
+    global pegs
     if not is_valid_move(frm, to):
         return False
     r1, c1 = index_to_pos[frm]
     r2, c2 = index_to_pos[to]
     mid_r, mid_c = (r1 + r2) // 2, (c1 + c2) // 2
 
-    board[r1][c1] = 0
-    board[mid_r][mid_c] = 0
-    board[r2][c2] = 1
+    pegs ^= index_to_bit[frm] | (1 << (mid_r*COLS + mid_c)) | index_to_bit[to]
     return True
 
 # ---------------------------------------------------------
 
 def peg_count() -> int:
-    return sum(cell == 1 for row in board for cell in row)
+    return pegs.bit_count()
 
 def print_help():
     print("""
@@ -141,8 +83,8 @@ def list_moves():
         print("No legal moves.")
         return
     by_from: Dict[int, List[int]] = {}
-    for f, t in lm:
-        by_from.setdefault(f, []).append(t)
+    for f, _, t in lm:
+        by_from.setdefault(bit_to_index[f], []).append(bit_to_index[t])
     for f in sorted(by_from):
         tos = ", ".join(str(t) for t in sorted(by_from[f]))
         print(f"{f} -> {tos}")